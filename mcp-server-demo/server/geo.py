@@ -0,0 +1,181 @@
+# file: server/geo.py
+"""Shared city geocoding for the timezone and weather tools.
+
+Both tools used to resolve cities through their own copies of the same
+Open-Meteo lookup, so "weather in chennai" followed by "chennai to london"
+sent two identical HTTP requests. One geocode() coroutine now serves both
+callers, and every caching layer - bounded in-memory LRU, in-flight
+coalescing, short-TTL negative cache, on-disk persistence - is shared, so
+a city resolved by one tool is already warm for the other.
+
+This module registers no MCP tools; main.py skips it because it defines
+no register() function.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+
+import httpx
+from collections import OrderedDict
+
+logging.getLogger("httpx").setLevel(logging.CRITICAL)
+
+# orjson parses the small geocode payloads a few times faster than the
+# stdlib and takes raw bytes, skipping an intermediate str decode; fall
+# back to the stdlib when it is not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+GEO_API = "https://geocoding-api.open-meteo.com/v1/search"
+
+# Shared pooled HTTP client: keepalive connections let repeated API calls
+# reuse the TCP+TLS connection instead of handshaking per call. Built
+# lazily so importing the module never touches the network stack.
+_client: httpx.AsyncClient | None = None
+
+# City -> place results are effectively immutable; memoize them so repeat
+# queries skip the network. Bounded LRU eviction keeps memory flat while
+# holding on to the cities that are actually being asked about.
+_CACHE_MAX = 1024
+_GEO_CACHE: OrderedDict[str, dict | None] = OrderedDict()
+
+# In-flight lookups keyed like _GEO_CACHE: concurrent misses for the same
+# city all await one Future instead of each firing their own HTTP request
+_INFLIGHT: dict[str, asyncio.Future] = {}
+
+# Empty geocoder results are cached separately with a short TTL: junk input
+# cannot hammer the API repeatedly, yet a place the geocoder learns about
+# later is not shut out forever. Values are monotonic expiry timestamps.
+_NEG_TTL = 300
+_NEG_CACHE: dict[str, float] = {}
+
+# Characters that never appear in a real place name - rejected before
+# spending a network round trip on the query
+_JUNK_RE = re.compile(r"[0-9@#$%^*(){}\[\]]")
+
+# On-disk layer under the in-memory cache: geocoding answers for a given
+# city never change on human timescales, so persisting them gives warm
+# starts across process restarts at zero network cost. Plain JSON files,
+# one per key; every failure mode degrades to a cache miss.
+_GEO_DISK_DIR = os.path.expanduser("~/.cache/dotfit/geo-http")
+_GEO_DISK_TTL = 30 * 86400
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        # Gzip roughly halves the JSON payloads; br is left out because a
+        # brotli decoder is not one of this project's dependencies
+        kwargs = dict(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={"Accept-Encoding": "gzip"},
+        )
+        try:
+            # HTTP/2 multiplexes concurrent lookups over one TLS
+            # connection; needs the optional h2 package (httpx[http2])
+            _client = httpx.AsyncClient(http2=True, **kwargs)
+        except ImportError:
+            _client = httpx.AsyncClient(**kwargs)
+    return _client
+
+
+def _disk_cache_path(key: str) -> str:
+    return os.path.join(_GEO_DISK_DIR, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+
+def _disk_cache_get(key: str) -> dict | None:
+    try:
+        path = _disk_cache_path(key)
+        if time.time() - os.path.getmtime(path) > _GEO_DISK_TTL:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _disk_cache_set(key: str, value: dict) -> None:
+    try:
+        os.makedirs(_GEO_DISK_DIR, exist_ok=True)
+        path = _disk_cache_path(key)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+async def geocode(city: str) -> dict | None:
+    """Resolve a city name to its place record, or None when unknown.
+
+    The record carries every field either caller projects from it:
+    {"lat", "lon", "name", "country", "timezone"}.
+    """
+    key = city.lower().strip()
+    if len(key) < 2 or _JUNK_RE.search(key):
+        return None
+
+    if key in _GEO_CACHE:
+        _GEO_CACHE.move_to_end(key)  # refresh recency so hits stay resident
+        return _GEO_CACHE[key]
+
+    neg_expiry = _NEG_CACHE.get(key)
+    if neg_expiry is not None:
+        if time.monotonic() < neg_expiry:
+            return None
+        del _NEG_CACHE[key]
+
+    inflight = _INFLIGHT.get(key)
+    if inflight is not None:
+        return await inflight
+
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = fut
+    place = None
+    failed = False
+    try:
+        cached = _disk_cache_get("place:" + key)
+        if cached is not None:
+            place = cached.get("place")
+        else:
+            params = {"name": city, "count": 1, "language": "en"}
+            try:
+                r = await get_client().get(GEO_API, params=params)
+                data = _json_loads(r.content)
+                if data.get("results"):
+                    result = data["results"][0]
+                    place = {
+                        "lat": result["latitude"],
+                        "lon": result["longitude"],
+                        "name": result["name"],
+                        "country": result.get("country", "Unknown"),
+                        "timezone": result.get("timezone"),
+                    }
+            except Exception:
+                failed = True  # transient failures stay uncached
+            else:
+                if place is not None:
+                    _disk_cache_set("place:" + key, {"place": place})
+        if not failed:
+            if place is None:
+                if len(_NEG_CACHE) > _CACHE_MAX:
+                    _NEG_CACHE.clear()
+                _NEG_CACHE[key] = time.monotonic() + _NEG_TTL
+            else:
+                _GEO_CACHE[key] = place
+                if len(_GEO_CACHE) > _CACHE_MAX:
+                    _GEO_CACHE.popitem(last=False)
+    finally:
+        # Resolve the Future even on failure so waiters never hang
+        _INFLIGHT.pop(key, None)
+        fut.set_result(place)
+    return place
@@ -7,18 +7,33 @@ from mcp.server import FastMCP # type: ignore
 mcp = FastMCP("tool_hub")
 
 
+# Tool module names discovered once at import - the directory is only
+# scanned a single time per process
+_TOOLS_DIR = "server"
+_TOOL_MODULES = tuple(sorted(
+    filename[:-3]
+    for filename in os.listdir(_TOOLS_DIR)
+    if filename.endswith(".py") and not filename.startswith("__")
+))
+
+_tools_loaded = False
+
+
 def load_tools():
-    tools_dir = "server"
-
-    for filename in os.listdir(tools_dir):
-        if filename.endswith(".py") and not filename.startswith("__"):
-            module_name = filename[:-3]
-            module = importlib.import_module(f"{tools_dir}.{module_name}")
-            #print(module_name) # debug processing...
-            
-            # If the module has a register function, call it
-            if hasattr(module, "register"):
-                module.register(mcp)
+    # Idempotent: re-running (e.g. on reload) must not re-import modules or
+    # register duplicate tools
+    global _tools_loaded
+    if _tools_loaded:
+        return
+    _tools_loaded = True
+
+    for module_name in _TOOL_MODULES:
+        module = importlib.import_module(f"{_TOOLS_DIR}.{module_name}")
+        #print(module_name) # debug processing...
+
+        # If the module has a register function, call it
+        if hasattr(module, "register"):
+            module.register(mcp)
 
 
 load_tools()